@@ -1,15 +1,63 @@
-from zict.async_buffer import AsyncBuffer as AsyncBuffer
-from zict.buffer import Buffer as Buffer
-from zict.cache import Cache as Cache
-from zict.cache import WeakValueMapping as WeakValueMapping
-from zict.file import File as File
-from zict.func import Func as Func
-from zict.keymap import KeyMap as KeyMap
-from zict.lmdb import LMDB as LMDB
-from zict.lru import LRU as LRU
-from zict.sieve import Sieve as Sieve
-from zict.utils import InsertionSortedSet as InsertionSortedSet
-from zict.zip import Zip as Zip
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from zict.async_buffer import AsyncBuffer as AsyncBuffer
+    from zict.buffer import Buffer as Buffer
+    from zict.cache import Cache as Cache
+    from zict.cache import WeakValueMapping as WeakValueMapping
+    from zict.file import File as File
+    from zict.func import Func as Func
+    from zict.keymap import KeyMap as KeyMap
+    from zict.lmdb import LMDB as LMDB
+    from zict.lru import LRU as LRU
+    from zict.sieve import Sieve as Sieve
+    from zict.utils import InsertionSortedSet as InsertionSortedSet
+    from zict.zip import Zip as Zip
 
 # Must be kept aligned with setup.cfg
 __version__ = "3.1.0"
+
+# Submodules are imported lazily on first access (PEP 562). Most notably, this avoids
+# importing asyncio, which dominates the import time of zict, unless AsyncBuffer is
+# actually used.
+_lazy_imports = {
+    "AsyncBuffer": "zict.async_buffer",
+    "Buffer": "zict.buffer",
+    "Cache": "zict.cache",
+    "WeakValueMapping": "zict.cache",
+    "File": "zict.file",
+    "Func": "zict.func",
+    "KeyMap": "zict.keymap",
+    "LMDB": "zict.lmdb",
+    "LRU": "zict.lru",
+    "Sieve": "zict.sieve",
+    "InsertionSortedSet": "zict.utils",
+    "Zip": "zict.zip",
+}
+
+__all__ = list(_lazy_imports)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        modname = _lazy_imports[name]
+    except KeyError:
+        # Submodules, e.g. zict.file, were accessible after a bare ``import zict``
+        # when all of them were imported eagerly
+        submodname = f"{__name__}.{name}"
+        try:
+            return importlib.import_module(submodname)
+        except ModuleNotFoundError as e:
+            if e.name != submodname:
+                raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(modname), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*__all__, "__version__"})
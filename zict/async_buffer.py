@@ -9,7 +9,7 @@ from itertools import chain
 from typing import Any, Literal
 
 from zict.buffer import Buffer
-from zict.common import KT, VT, T, locked
+from zict.common import KT, VT, T
 
 
 class AsyncBuffer(Buffer[KT, VT]):
@@ -33,14 +33,24 @@ class AsyncBuffer(Buffer[KT, VT]):
 
     executor: concurrent.futures.Executor, optional
         An Executor instance to use for offloading. It must not pickle/unpickle.
-        Defaults to an internal ThreadPoolExecutor.
+        Defaults to an internal ThreadPoolExecutor, which is created on the first
+        offload and shut down by :meth:`close`.
+        If you create and destroy many short-lived AsyncBuffers, pass the same
+        executor to all of them to avoid paying for thread startup every time; it
+        won't be shut down by :meth:`close`.
     nthreads: int, optional
         Number of offloaded threads to run in parallel. Defaults to 1.
         Mutually exclusive with executor parameter.
+    propagate_context: bool, optional
+        If True (default), run the offloaded functions (``slow.__getitem__``,
+        ``slow.__setitem__``, and callbacks) within a copy of the
+        :mod:`contextvars` context of the caller. Set to False to save the cost of
+        copying the context on every offload if your callbacks don't need it.
     """
 
     executor: Executor | None
     nthreads: int | None
+    propagate_context: bool
     futures: set[asyncio.Future]
     evicting: dict[asyncio.Future, float]
 
@@ -50,14 +60,17 @@ class AsyncBuffer(Buffer[KT, VT]):
         *args: Any,
         executor: Executor | None = None,
         nthreads: int = 1,
+        propagate_context: bool = True,
         **kwargs: Any,
     ) -> None:
-        super().__init__(*args, **kwargs)
+        # Set these first, so that close() works if Buffer.__init__ raises
         self.executor = executor
         self.nthreads = None if executor else nthreads
+        self.propagate_context = propagate_context
         self._internal_executor = executor is None
         self.futures = set()
         self.evicting = {}
+        super().__init__(*args, **kwargs)
 
     def close(self) -> None:
         # Call LRU.close(), which stops LRU.evict_until_below_target() halfway through
@@ -76,16 +89,21 @@ class AsyncBuffer(Buffer[KT, VT]):
             )
 
         loop = asyncio.get_running_loop()
-        context = contextvars.copy_context()
-        future = loop.run_in_executor(self.executor, context.run, func, *args)
+        if self.propagate_context:
+            context = contextvars.copy_context()
+            future = loop.run_in_executor(self.executor, context.run, func, *args)
+        else:
+            future = loop.run_in_executor(self.executor, func, *args)
         self.futures.add(future)
         future.add_done_callback(self.futures.remove)
         return future  # type: ignore[return-value]
 
     # Return an asyncio.Future, instead of just writing it as an async function, to make
     # it easier for overriders to tell apart the use case when all keys were already
-    # in fast
-    @locked
+    # in fast.
+    # This method does not acquire the Buffer's lock, which may be held for a long time
+    # by the offloaded thread (e.g. while deleting a key from slow), so that it never
+    # blocks the event loop. LRU.get_all_or_nothing is thread-safe on its own.
     def async_get(
         self, keys: Collection[KT], missing: Literal["raise", "omit"] = "raise"
     ) -> asyncio.Future[dict[KT, VT]]:
@@ -110,29 +128,31 @@ class AsyncBuffer(Buffer[KT, VT]):
         internally calls ``__delitem__`` in a non-atomic way, so you may get
         ``KeyError`` when updating a value too.
         """
+        if missing not in ("raise", "omit"):
+            raise ValueError(f"missing: expected raise or omit; got {missing}")
+
+        # Fast path: all keys are in fast. Don't bother checking if they're in slow.
+        # Do not pull keys towards the top of the LRU unless they are all available.
+        # This matters when there is a very long queue of async_get futures.
+        try:
+            return _completed_future(self.fast.get_all_or_nothing(keys))
+        except KeyError:
+            pass
+
         # This block avoids spawning a thread if keys are missing from both fast and
         # slow. It is otherwise just a performance optimization.
         if missing == "omit":
             keys = [key for key in keys if key in self]
-        elif missing == "raise":
+            try:
+                return _completed_future(self.fast.get_all_or_nothing(keys))
+            except KeyError:
+                pass
+        else:
             for key in keys:
                 if key not in self:
                     raise KeyError(key)
-        else:
-            raise ValueError(f"missing: expected raise or omit; got {missing}")
         # End performance optimization
 
-        try:
-            # Do not pull keys towards the top of the LRU unless they are all available.
-            # This matters when there is a very long queue of async_get futures.
-            d = self.fast.get_all_or_nothing(keys)
-        except KeyError:
-            pass
-        else:
-            f: asyncio.Future[dict[KT, VT]] = asyncio.Future()
-            f.set_result(d)
-            return f
-
         def _async_get() -> dict[KT, VT]:
             d = {}
             for k in keys:
@@ -154,14 +174,18 @@ class AsyncBuffer(Buffer[KT, VT]):
         """Immediately set a key in fast. If this causes the total weight to exceed n,
         asynchronously start moving keys from fast to slow in a worker thread.
         """
+        # Unlike async_get and async_evict_until_below_target, this acquires the
+        # Buffer's lock in set_noevict, so it can block the event loop while the
+        # offloaded thread holds it.
         self.set_noevict(key, value)
         self.async_evict_until_below_target()
 
-    @locked
     def async_evict_until_below_target(self, n: float | None = None) -> None:
         """If the total weight exceeds n, asynchronously start moving keys from fast to
         slow in a worker thread.
         """
+        # Don't acquire the Buffer's lock, so that the event loop is never blocked by
+        # the offloaded thread. self.evicting is only ever accessed from the event loop.
         if n is None:
             n = self.n
         n = max(0.0, n)
@@ -174,3 +198,9 @@ class AsyncBuffer(Buffer[KT, VT]):
         future = self._offload(self.evict_until_below_target, n)
         self.evicting[future] = n
         future.add_done_callback(self.evicting.__delitem__)
+
+
+def _completed_future(result: T) -> asyncio.Future[T]:
+    f: asyncio.Future[T] = asyncio.Future()
+    f.set_result(result)
+    return f
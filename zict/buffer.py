@@ -30,6 +30,13 @@ class Buffer(ZictBase[KT, VT]):
         storing to disk and raised a disk full error) the key will remain in the LRU.
     slow_to_fast_callbacks: list of callables
         These functions run every time data moves form the slow to the fast mapping.
+    promote_after: int, optional
+        Number of times a key must be read from slow before it is moved back to fast.
+        Defaults to 1, i.e. on the first read. Higher values prevent scan-like
+        workloads, which read many keys from slow only once, from flushing the hot
+        keys out of fast and then immediately evicting the scanned keys again.
+        Reads are counted for at most as many keys as there are in fast, or one if
+        fast is empty; the least recently read keys are forgotten first.
 
     Notes
     -----
@@ -56,7 +63,9 @@ class Buffer(ZictBase[KT, VT]):
     weight: Callable[[KT, VT], float]
     fast_to_slow_callbacks: list[Callable[[KT, VT], None]]
     slow_to_fast_callbacks: list[Callable[[KT, VT], None]]
+    promote_after: int
     _cancel_restore: dict[KT, bool]
+    _touches: dict[KT, int]
 
     def __init__(
         self,
@@ -70,6 +79,7 @@ class Buffer(ZictBase[KT, VT]):
         slow_to_fast_callbacks: Callable[[KT, VT], None]
         | list[Callable[[KT, VT], None]]
         | None = None,
+        promote_after: int = 1,
     ):
         super().__init__()
         self.fast = LRU(
@@ -87,7 +97,12 @@ class Buffer(ZictBase[KT, VT]):
             slow_to_fast_callbacks = [slow_to_fast_callbacks]
         self.fast_to_slow_callbacks = fast_to_slow_callbacks or []
         self.slow_to_fast_callbacks = slow_to_fast_callbacks or []
+        self.promote_after = promote_after
         self._cancel_restore = {}
+        self._touches = {}
+        # Validate after all attributes are set, so that __del__ -> close() works
+        if promote_after < 1:
+            raise ValueError(f"promote_after must be at least 1; got {promote_after}")
 
     @property
     def n(self) -> float:
@@ -143,18 +158,34 @@ class Buffer(ZictBase[KT, VT]):
             raise
 
     def slow_to_fast(self, key: KT) -> VT:
-        self._cancel_restore[key] = False
+        # Hot path; bind attributes to locals
+        fast = self.fast
+        slow = self.slow
+        cancel_restore = self._cancel_restore
+
+        cancel_restore[key] = False
         try:
             with self.unlock():
-                value = self.slow[key]
-            if self._cancel_restore[key]:
+                value = slow[key]
+            if cancel_restore[key]:
                 raise KeyError(key)
         finally:
-            del self._cancel_restore[key]
+            del cancel_restore[key]
+
+        if self.promote_after > 1:
+            touches_d = self._touches
+            # Move the key to the end of the dict, so that it's forgotten last
+            touches = touches_d.pop(key, 0) + 1
+            if touches < self.promote_after:
+                touches_d[key] = touches
+                # Don't let keys that are read only once accumulate
+                while len(touches_d) > max(len(fast), 1):
+                    del touches_d[next(iter(touches_d))]
+                # Leave the key in slow
+                return value
 
         # Avoid useless movement for heavy values
-        w = self.weight(key, value)
-        if w <= self.n:
+        if (w := self.weight(key, value)) <= fast.n:
             # Multithreaded edge case:
             # - Thread 1 starts slow_to_fast(x) and puts it at the top of fast
             # - This causes the eviction of older key(s)
@@ -164,28 +195,38 @@ class Buffer(ZictBase[KT, VT]):
             #   enough weight in fast that thread 1 will spill x
             # - If the below code was just `self.fast[key] = value; del
             #   self.slow[key]` now the key would be in neither slow nor fast!
-            self.fast.set_noevict(key, value)
-            del self.slow[key]
+            # Don't compute the weight a second time
+            fast._set_noevict(key, value, w)
+            del slow[key]
 
         with self.unlock():
-            self.fast.evict_until_below_target()
+            fast.evict_until_below_target()
             for cb in self.slow_to_fast_callbacks:
                 cb(key, value)
 
         return value
 
-    @locked
     def __getitem__(self, key: KT) -> VT:
+        # Fast path: LRU is thread-safe on its own, so a hit in fast doesn't need to
+        # acquire the Buffer's lock
         try:
             return self.fast[key]
         except KeyError:
-            return self.slow_to_fast(key)
+            pass
+
+        with self.lock:
+            # The key may have been restored by another thread in the meantime
+            try:
+                return self.fast[key]
+            except KeyError:
+                return self.slow_to_fast(key)
 
     def __setitem__(self, key: KT, value: VT) -> None:
         with self.lock:
             discard(self.slow, key)
             if key in self._cancel_restore:
                 self._cancel_restore[key] = True
+            self._touches.pop(key, None)
         self.fast[key] = value
 
     @locked
@@ -196,6 +237,7 @@ class Buffer(ZictBase[KT, VT]):
         discard(self.slow, key)
         if key in self._cancel_restore:
             self._cancel_restore[key] = True
+        self._touches.pop(key, None)
         self.fast.set_noevict(key, value)
 
     def evict_until_below_target(self, n: float | None = None) -> None:
@@ -208,6 +250,7 @@ class Buffer(ZictBase[KT, VT]):
     def __delitem__(self, key: KT) -> None:
         if key in self._cancel_restore:
             self._cancel_restore[key] = True
+        self._touches.pop(key, None)
         try:
             del self.fast[key]
         except KeyError:
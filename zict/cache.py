@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 import weakref
-from collections.abc import Iterator, MutableMapping
+from collections.abc import Iterable, Iterator, MutableMapping
 
-from zict.common import KT, VT, ZictBase, close, discard, flush, locked
+from zict.common import KT, VT, ZictBase, close, discard, flush, locked, nodefault
 
 
 class Cache(ZictBase[KT, VT]):
@@ -59,10 +59,11 @@ class Cache(ZictBase[KT, VT]):
 
     @locked
     def __getitem__(self, key: KT) -> VT:
-        try:
-            return self.cache[key]
-        except KeyError:
-            pass
+        # Avoid the cost of raising and catching KeyError on a cache miss, which is
+        # the common case e.g. with WeakValueMapping
+        value = self.cache.get(key, nodefault)
+        if value is not nodefault:
+            return value
         gen = self._last_updated[key]
 
         with self.unlock():
@@ -77,16 +78,49 @@ class Cache(ZictBase[KT, VT]):
 
     @locked
     def __setitem__(self, key: KT, value: VT) -> None:
-        # If the item was already in cache and data.__setitem__ fails, e.g. because
-        # it's a File and the disk is full, make sure that the cache is invalidated.
-        discard(self.cache, key)
+        gen = self._before_set(key)
+        try:
+            with self.unlock():
+                self.data[key] = value
+        except BaseException:
+            # If the item was already in cache and data.__setitem__ fails, e.g.
+            # because it's a File and the disk is full, make sure that the cache is
+            # invalidated.
+            discard(self.cache, key)
+            raise
+        self._after_set(key, value, gen)
+
+    @locked
+    def _do_update(self, items: Iterable[tuple[KT, VT]]) -> None:
+        # Optimized update() implementation issuing a single update() call on data,
+        # which may in turn be optimized (e.g. LMDB or Sieve)
+        updates = dict(items)
+        gens = {key: self._before_set(key) for key in updates}
+        try:
+            with self.unlock():
+                self.data.update(updates)
+        except BaseException:
+            for key in updates:
+                discard(self.cache, key)
+            raise
+        for key, value in updates.items():
+            self._after_set(key, value, gens[key])
+
+    def _before_set(self, key: KT) -> int:
+        """Must be called with the lock held before writing a key to data.
+        Return the generation to be passed to :meth:`_after_set`.
+        """
+        # If update_on_set=True, the cache is instead overwritten by _after_set or
+        # invalidated by the caller if writing to data fails; don't pop it twice.
+        if not self.update_on_set:
+            discard(self.cache, key)
         gen = self._gen
         gen += 1
         self._last_updated[key] = self._gen = gen
+        return gen
 
-        with self.unlock():
-            self.data[key] = value
-
+    def _after_set(self, key: KT, value: VT, gen: int) -> None:
+        """Must be called with the lock held after writing a key to data"""
         if key not in self._last_updated:
             # Another thread called __delitem__ in the meantime
             discard(self.data, key)
@@ -134,7 +168,8 @@ class WeakValueMapping(weakref.WeakValueDictionary[KT, VT]):
     """
 
     def __setitem__(self, key: KT, value: VT) -> None:
-        try:
+        # Avoid the cost of raising and catching TypeError every time a
+        # non-weakrefable object is inserted. Types that support weakrefs have a
+        # non-zero offset of their weakref list.
+        if type(value).__weakrefoffset__:
             super().__setitem__(key, value)
-        except TypeError:
-            pass
@@ -108,6 +108,12 @@ def discard(m: MutableMapping[KT, VT], key: KT) -> None:
     """Flush *key* if possible.
     Not the same as ``m.pop(key, None)``, as it doesn't trigger ``__getitem__``.
     """
+    if type(m) is dict:
+        # Fast path: a single hash lookup and no exception handling.
+        # dict.pop doesn't call __getitem__; subclasses may override it so they are
+        # not eligible.
+        m.pop(key, None)
+        return
     try:
         del m[key]
     except KeyError:
@@ -1,14 +1,110 @@
 from __future__ import annotations
 
+import contextlib
+import io
 import mmap
 import os
 import pathlib
 from collections.abc import Iterator
+from functools import lru_cache
 from urllib.parse import quote, unquote
 
 from zict.common import ZictBase, locked
 
 
+@lru_cache(maxsize=2**14)
+def _quote(key: str) -> str:
+    """Cached ``quote(key, safe="")``. urllib's quote is pure Python and, with dask,
+    the same keys are typically written over and over again as they are spilled,
+    unspilled, and spilled again.
+    """
+    return quote(key, safe="")
+
+
+def _get_iov_max() -> int:
+    """Maximum number of buffers that can be passed to a single writev() call"""
+    try:
+        iov_max = os.sysconf("SC_IOV_MAX")
+    except (AttributeError, ValueError, OSError):
+        return 1024
+    # -1 means that there is no fixed limit
+    return iov_max if iov_max > 0 else 1024
+
+
+_IOV_MAX = _get_iov_max()
+
+
+# File(populate=True): prefault all pages of a memory-mapped file in a single system
+# call, instead of page-faulting one page at a time while the buffer is being
+# deserialized. Linux only; exposed by the mmap module since Python 3.10.
+_MMAP_FLAGS = (
+    mmap.MAP_SHARED | mmap.MAP_POPULATE if hasattr(mmap, "MAP_POPULATE") else 0
+)
+# Where MAP_POPULATE is not available, ask the kernel to start reading ahead instead
+_MADV_WILLNEED = getattr(mmap, "MADV_WILLNEED", None)
+
+
+def _writev(fd: int, buffers: list | tuple) -> int:
+    """Write a sequence of buffers to a file descriptor with as few system calls as
+    possible. Unlike ``BufferedWriter.writelines``, which issues one ``write()`` per
+    buffer that doesn't fit in its internal buffer, this issues a single
+    ``writev()`` unless the kernel performs a partial write.
+
+    Return the total number of bytes written.
+    """
+    views = [memoryview(buf).cast("B") for buf in buffers]
+    # Views are cast to bytes, so len() is nbytes; map(len) keeps the loop in C
+    total = sum(map(len, views))
+    if not hasattr(os, "writev"):  # Windows
+        for view in views:
+            while view:
+                view = view[os.write(fd, view) :]
+        return total
+
+    i = 0
+    while i < len(views):
+        nwritten = os.writev(fd, views[i : i + _IOV_MAX])
+        # Skip the buffers that were written completely and trim the one that was
+        # written partially, if any
+        while i < len(views) and nwritten >= views[i].nbytes:
+            nwritten -= views[i].nbytes
+            i += 1
+        if nwritten:
+            views[i] = views[i][nwritten:]
+    return total
+
+
+# Python file descriptors are not inheritable by default; O_BINARY is Windows only
+_O_RDONLY = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+# Don't update the access time on reads, which would be a metadata write. Linux only;
+# only allowed on files owned by the current user.
+_O_NOATIME = getattr(os, "O_NOATIME", 0)
+# Filenames are unique; never overwrite an existing file
+_O_WRONLY = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+
+def _readinto(fd: int, buf: bytearray) -> int:
+    """Fill buf from a file descriptor. A read may return less than requested, so loop
+    until the buffer is full or EOF is reached.
+    """
+    nread = 0
+    with memoryview(buf) as view:
+        if hasattr(os, "readv"):
+            while nread < len(view):
+                n = os.readv(fd, [view[nread:]])
+                if not n:
+                    break
+                nread += n
+        else:  # Windows
+            with io.FileIO(fd, closefd=False) as fh:
+                while nread < len(view):
+                    n = fh.readinto(view[nread:])
+                    if not n:
+                        break
+                    nread += n
+    return nread
+
+
 class File(ZictBase[str, bytes]):
     """Mutable Mapping interface to a directory
 
@@ -24,6 +120,18 @@ class File(ZictBase[str, bytes]):
         mapping elements. If it doesn't exists, it will be created.
     memmap: bool (optional)
         If True, use `mmap` for reading. Defaults to False.
+    advise: bool (optional)
+        If True, hint the kernel with ``posix_fadvise`` that files are read
+        sequentially and that their pages won't be needed again in the page cache
+        after they've been written. This reduces page cache pollution when files are
+        typically written and read back only once, e.g. when spilling. It has no
+        effect on platforms that don't support ``posix_fadvise``. Defaults to False.
+    populate: bool (optional)
+        Only meaningful when ``memmap=True``. If True, read the whole file into memory
+        as soon as it is mapped (``MAP_POPULATE`` on Linux; ``madvise(MADV_WILLNEED)``
+        elsewhere), instead of page-faulting one page at a time when the buffer is
+        accessed. This is faster when the whole buffer is going to be read anyway,
+        e.g. to deserialize it, but wasteful if only part of it is. Defaults to False.
 
     Notes
     -----
@@ -35,6 +143,8 @@ class File(ZictBase[str, bytes]):
     on Windows, NFS, and in general whenever it's not OK to delete a file while there
     are file descriptors open on it.
 
+    ``__getitem__`` never acquires the lock.
+
     Examples
     --------
     >>> z = File('myfile')  # doctest: +SKIP
@@ -55,22 +165,47 @@ class File(ZictBase[str, bytes]):
 
     directory: str
     memmap: bool
+    populate: bool
+    advise: bool
     filenames: dict[str, str]
+    _sizes: dict[str, int]
     _inc: int
+    _prefix: str
 
-    def __init__(self, directory: str | pathlib.Path, memmap: bool = False):
+    def __init__(
+        self,
+        directory: str | pathlib.Path,
+        memmap: bool = False,
+        advise: bool = False,
+        populate: bool = False,
+    ):
         super().__init__()
         self.directory = str(directory)
+        # Precompute the directory prefix to avoid os.path.join on every access
+        self._prefix = os.path.join(self.directory, "")
         self.memmap = memmap
+        self.populate = populate
+        self.advise = advise and hasattr(os, "posix_fadvise")
         self.filenames = {}
+        # {filename: size} of the files written by this instance, so that reading
+        # them back doesn't need to fstat() them. Filenames are unique to every write.
+        self._sizes = {}
         self._inc = 0
 
-        if not os.path.exists(self.directory):
+        # Try creating the directory first; in the common case of a new directory,
+        # this is a single system call.
+        try:
+            os.mkdir(self.directory)
+        except FileNotFoundError:
             os.makedirs(self.directory, exist_ok=True)
-        else:
-            for fn in os.listdir(self.directory):
-                self.filenames[self._unsafe_key(fn)] = fn
-                self._inc += 1
+        except FileExistsError:
+            # os.scandir retrieves the file type together with the name, so is_file()
+            # doesn't cost an additional stat() call on most platforms
+            with os.scandir(self.directory) as it:
+                names = [entry.name for entry in it if entry.is_file()]
+            self.filenames = {self._unsafe_key(fn): fn for fn in names}
+            # Never reuse the suffix of an imported file
+            self._inc = max((self._suffix(fn) for fn in names), default=-1) + 1
 
     def _safe_key(self, key: str) -> str:
         """Escape key so that it is usable on all filesystems.
@@ -80,24 +215,46 @@ class File(ZictBase[str, bytes]):
         key, e.g. ``__setitem__`` on one thread and ``__getitem__`` on another.
         """
         # `#` is escaped by quote and is supported by most file systems
-        key = quote(key, safe="") + f"#{self._inc}"
+        # Alphanumeric keys (e.g. hex tokens) need no escaping. Don't let them evict
+        # more complex, repeatedly spilled keys from the cache of _quote.
+        if not (type(key) is str and key.isascii() and key.isalnum()):
+            key = _quote(key)
+        key += f"#{self._inc}"
         self._inc += 1
         return key
 
     @staticmethod
     def _unsafe_key(key: str) -> str:
         """Undo the escaping done by _safe_key()"""
-        key = key.split("#")[0]
-        return unquote(key)
+        return unquote(key.partition("#")[0])
+
+    @staticmethod
+    def _suffix(fn: str) -> int:
+        """Return the unique suffix appended by _safe_key(), or -1 if there is none"""
+        suffix = fn.rpartition("#")[2]
+        return int(suffix) if suffix.isdecimal() else -1
 
     def __str__(self) -> str:
         return f"<File: {self.directory}, {len(self)} elements>"
 
     __repr__ = __str__
 
-    @locked
     def __getitem__(self, key: str) -> bytearray | memoryview:
-        fn = os.path.join(self.directory, self.filenames[key])
+        # Don't acquire the lock, so that reads never wait for each other or for the
+        # system calls of writes and deletions. Reading self.filenames is atomic.
+        while True:
+            fn = self.filenames[key]
+            try:
+                return self._read(fn)
+            except FileNotFoundError:
+                if self.filenames.get(key) == fn:
+                    raise
+                # Race condition: another thread deleted or replaced the key after we
+                # looked up its filename. Try again; raise KeyError if it was deleted.
+
+    def _read(self, fn: str) -> bytearray | memoryview:
+        size = self._sizes.get(fn)
+        fn = self._prefix + fn
 
         # distributed.protocol.numpy.deserialize_numpy_ndarray makes sure that, if the
         # numpy array was writeable before serialization, remains writeable afterwards.
@@ -108,15 +265,36 @@ class File(ZictBase[str, bytes]):
 
         if self.memmap:
             with open(fn, "r+b") as fh:
-                return memoryview(mmap.mmap(fh.fileno(), 0))
+                if not self.populate:
+                    return memoryview(mmap.mmap(fh.fileno(), 0))
+                if _MMAP_FLAGS:
+                    return memoryview(mmap.mmap(fh.fileno(), 0, flags=_MMAP_FLAGS))
+                mm = mmap.mmap(fh.fileno(), 0)
+                if _MADV_WILLNEED is not None:
+                    mm.madvise(_MADV_WILLNEED)
+                return memoryview(mm)
         else:
-            with open(fn, "rb") as fh:
-                size = os.fstat(fh.fileno()).st_size
+            # Read straight into the output buffer from a bare file descriptor, without
+            # allocating and copying through a BufferedReader and without the fstat()
+            # call that open() performs to reject directories
+            try:
+                fd = os.open(fn, _O_RDONLY | _O_NOATIME)
+            except PermissionError:
+                if not _O_NOATIME:
+                    raise
+                # File imported from a directory populated by another user
+                fd = os.open(fn, _O_RDONLY)
+            try:
+                if size is None:
+                    size = os.fstat(fd).st_size
+                if self.advise:
+                    os.posix_fadvise(fd, 0, size, os.POSIX_FADV_SEQUENTIAL)
                 buf = bytearray(size)
-                with self.unlock():
-                    nread = fh.readinto(buf)
-                assert nread == size
-                return buf
+                nread = _readinto(fd, buf)
+            finally:
+                os.close(fd)
+            assert nread == size
+            return buf
 
     @locked
     def __setitem__(
@@ -128,20 +306,39 @@ class File(ZictBase[str, bytes]):
         | list[bytes | bytearray | memoryview]
         | tuple[bytes | bytearray | memoryview, ...],
     ) -> None:
-        self.discard(key)
         fn = self._safe_key(key)
-        with open(os.path.join(self.directory, fn), "wb") as fh, self.unlock():
-            if isinstance(value, (tuple, list)):
-                fh.writelines(value)
-            else:
-                fh.write(value)
-
-        if key in self.filenames:
-            # Race condition: two calls to __setitem__ from different threads on the
-            # same key at the same time
-            os.remove(os.path.join(self.directory, fn))
-        else:
-            self.filenames[key] = fn
+        # Write straight from the input buffer(s) to a bare file descriptor, without
+        # copying through a BufferedWriter
+        fd = os.open(self._prefix + fn, _O_WRONLY, 0o666)
+        try:
+            with self.unlock():
+                if isinstance(value, (tuple, list)):
+                    size = _writev(fd, value)
+                else:
+                    size = _writev(fd, (value,))
+                if self.advise:
+                    # Dirty pages are not dropped by DONTNEED until they are written
+                    # back, so this is only a best-effort hint
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except BaseException:
+            # e.g. disk full or invalid value type. Don't leave a partially written
+            # file behind; the previous value, if any, is left untouched.
+            os.close(fd)
+            # Don't let a failure to clean up hide the original exception
+            with contextlib.suppress(OSError):
+                os.remove(self._prefix + fn)
+            raise
+        os.close(fd)
+
+        # Replace the previous value, if any. Filenames are unique, so the new file
+        # never overwrites the old one. The key may also have been written by another
+        # thread while this one was writing; last one wins.
+        old_fn = self.filenames.get(key)
+        self.filenames[key] = fn
+        self._sizes[fn] = size
+        if old_fn is not None and old_fn != fn:
+            self._sizes.pop(old_fn, None)
+            os.remove(self._prefix + old_fn)
 
     def __contains__(self, key: object) -> bool:
         return key in self.filenames
@@ -152,7 +349,30 @@ class File(ZictBase[str, bytes]):
     @locked
     def __delitem__(self, key: str) -> None:
         fn = self.filenames.pop(key)
-        os.remove(os.path.join(self.directory, fn))
+        self._sizes.pop(fn, None)
+        # The key is already gone; no other thread can access this file anymore
+        with self.unlock():
+            os.remove(self._prefix + fn)
+
+    def clear(self) -> None:
+        # Unlike MutableMapping.clear(), acquire the lock only once and delete the files
+        # without holding it
+        with self.lock:
+            fns = list(self.filenames.values())
+            self.filenames.clear()
+            self._sizes.clear()
+        # The keys are already gone; don't leave the rest of the files behind if one of
+        # them fails to be deleted
+        exc = None
+        for fn in fns:
+            try:
+                os.remove(self._prefix + fn)
+            except FileNotFoundError:
+                pass  # Deleted from outside of zict
+            except OSError as e:
+                exc = e
+        if exc is not None:
+            raise exc
 
     def __len__(self) -> int:
         return len(self.filenames)
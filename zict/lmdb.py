@@ -11,8 +11,9 @@ def _encode_key(key: str) -> bytes:
     return key.encode("utf-8")
 
 
-def _decode_key(key: bytes) -> str:
-    return key.decode("utf-8")
+def _decode_key(key: bytes | memoryview) -> str:
+    # Unlike bytes.decode, this also accepts a memoryview
+    return str(key, "utf-8")
 
 
 class LMDB(ZictBase[str, bytes]):
@@ -84,8 +85,28 @@ class LMDB(ZictBase[str, bytes]):
         with self.db.begin() as txn:
             return txn.cursor().set_key(_encode_key(key))
 
+    def contains_many(self, keys: Iterable[object]) -> list[bool]:
+        """Equivalent to ``[key in self for key in keys]``, but using a single
+        transaction
+        """
+        with self.db.begin() as txn:
+            cursor = txn.cursor()
+            return [
+                isinstance(key, str) and cursor.set_key(_encode_key(key))
+                for key in keys
+            ]
+
+    def getmany(self, keys: Iterable[str]) -> dict[str, bytes]:
+        """Read multiple keys using a single transaction. Missing keys are omitted from
+        the output.
+        """
+        keys_enc = [_encode_key(key) for key in keys if isinstance(key, str)]
+        with self.db.begin() as txn:
+            return {_decode_key(k): v for k, v in txn.cursor().getmulti(keys_enc)}
+
     def __iter__(self) -> Iterator[str]:
-        cursor = self.db.begin().cursor()
+        # Decode keys straight from the memory map, without copying them to bytes first
+        cursor = self.db.begin(buffers=True).cursor()
         return (_decode_key(k) for k in cursor.iternext(keys=True, values=False))
 
     def items(self) -> ItemsView[str, bytes]:
@@ -96,16 +117,25 @@ class LMDB(ZictBase[str, bytes]):
 
     def _do_update(self, items: Iterable[tuple[str, bytes]]) -> None:
         # Optimized version of update() using a single putmulti() call.
-        items_enc = []
+        # Deduplicate (last one wins) and sort the keys, so that the B+tree is
+        # traversed in order.
+        items_dict = {}
         for key, value in items:
             if not isinstance(key, str):
                 raise TypeError(key)
             if not isinstance(value, bytes):
                 raise TypeError(value)
-            items_enc.append((_encode_key(key), value))
+            items_dict[_encode_key(key)] = value
+        items_enc = sorted(items_dict.items())
+        if not items_enc:
+            return
 
         with self.db.begin(write=True) as txn:
-            consumed, added = txn.cursor().putmulti(items_enc)
+            cursor = txn.cursor()
+            # If all new keys sort after the existing ones, append them to the last
+            # leaf page instead of searching for their position
+            append = not cursor.last() or cursor.key() < items_enc[0][0]
+            consumed, added = cursor.putmulti(items_enc, append=append)
             assert consumed == added == len(items_enc)
 
     def __delitem__(self, key: str) -> None:
@@ -138,8 +168,13 @@ class LMDBItemsView(ItemsView[str, bytes]):
             return v == value
 
     def __iter__(self) -> Iterator[tuple[str, bytes]]:
-        cursor = self._mapping.db.begin().cursor()
-        return ((_decode_key(k), v) for k, v in cursor.iternext(keys=True, values=True))
+        # Decode keys straight from the memory map, without copying them to bytes first.
+        # Buffers are only valid until the cursor moves, so values must be copied.
+        cursor = self._mapping.db.begin(buffers=True).cursor()
+        return (
+            (_decode_key(k), bytes(v))
+            for k, v in cursor.iternext(keys=True, values=True)
+        )
 
 
 class LMDBValuesView(ValuesView[bytes]):
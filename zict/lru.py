@@ -115,8 +115,7 @@ class LRU(ZictBase[KT, VT]):
     @locked
     def __getitem__(self, key: KT) -> VT:
         result = self.d[key]
-        self.order.remove(key)
-        self.order.add(key)
+        self.order.move_to_end(key)
         return result
 
     @locked
@@ -128,8 +127,7 @@ class LRU(ZictBase[KT, VT]):
         """
         result = {key: self.d[key] for key in keys}
         for key in keys:
-            self.order.remove(key)
-            self.order.add(key)
+            self.order.move_to_end(key)
         return result
 
     def __setitem__(self, key: KT, value: VT) -> None:
@@ -147,15 +145,24 @@ class LRU(ZictBase[KT, VT]):
                     pass
             raise
 
-    @locked
     def set_noevict(self, key: KT, value: VT) -> None:
         """Variant of ``__setitem__`` that does not evict if the total weight exceeds n.
         Unlike ``__setitem__``, this method does not depend on the ``on_evict``
         functions to be thread-safe for its own thread-safety. It also is not prone to
         re-raising exceptions from the ``on_evict`` callbacks.
         """
-        self.discard(key)
-        weight = self.weight(key, value)
+        self._set_noevict(key, value, self.weight(key, value))
+
+    @locked
+    def _set_noevict(self, key: KT, value: VT, weight: float) -> None:
+        """Implementation of :meth:`set_noevict` with a precomputed weight, for callers
+        that already had to compute it
+        """
+        if key in self.weights:
+            # Updating an existing key. Go through __delitem__, which subclasses may
+            # override. This is cheaper than calling discard(), which would raise and
+            # catch KeyError in the common case of a new key.
+            del self[key]
         if key in self._cancel_evict:
             self._cancel_evict[key] = True
         self.d[key] = value
@@ -175,9 +182,10 @@ class LRU(ZictBase[KT, VT]):
         """
         if n is None:
             n = self.n
+        evict = self.evict
         while self.total_weight + self.offset > n and not self.closed:
             try:
-                self.evict()
+                evict()
             except KeyError:
                 return  # Multithreaded race condition
 
@@ -199,41 +207,45 @@ class LRU(ZictBase[KT, VT]):
         another thread while the on_evict callbacks were being executed. This outcome is
         only possible in multithreaded access.
         """
+        # Hot path; bind attributes to locals
+        d = self.d
+        cancel_evict = self._cancel_evict
+
         if key is nodefault:
             try:
                 key = next(iter(self.heavy or self.order))
             except StopIteration:
                 raise KeyError("evict(): dictionary is empty")
 
-        if key in self._cancel_evict:
+        if key in cancel_evict:
             return None, None, 0
 
         # For the purpose of multithreaded access, it's important that the value remains
         # in self.d until all callbacks are successful.
         # When this is used inside a Buffer, there must never be a moment when the key
         # is neither in fast nor in slow.
-        value = self.d[key]
+        value = d[key]
 
         # If we are evicting a heavy key we just inserted and one of the callbacks
         # fails, put it at the bottom of the LRU instead of the top. This way lighter
         # keys will have a chance to be evicted first and make space.
         self.heavy.discard(key)
 
-        self._cancel_evict[key] = False
+        cancel_evict[key] = False
         try:
             with self.unlock():
                 # This may raise; e.g. if a callback tries storing to a full disk
                 for cb in self.on_evict:
                     cb(key, value)
 
-                if self._cancel_evict[key]:
+                if cancel_evict[key]:
                     for cb in self.on_cancel_evict:
                         cb(key, value)
                     return None, None, 0
         finally:
-            del self._cancel_evict[key]
+            del cancel_evict[key]
 
-        del self.d[key]
+        del d[key]
         self.order.remove(key)
         weight = self.weights.pop(key)
         self.total_weight -= weight
@@ -90,14 +90,18 @@ class Sieve(ZictBase[KT, VT], Generic[KT, VT, MKT]):
         self.gen += 1
         gen = self.gen
 
+        # Hot loop; bind attributes to locals
+        selector = self.selector
+        mappings = self.mappings
+        key_to_mapping = self.key_to_mapping
+
         for key, value in items:
-            old_mapping = self.key_to_mapping.pop(key, None)
+            old_mapping = key_to_mapping.pop(key, None)
             if old_mapping is not None:
                 discard(old_mapping, key)
-            mkey = self.selector(key, value)
-            mapping = self.mappings[mkey]
+            mkey = selector(key, value)
             updates[mkey].append((key, value))
-            self.key_to_mapping[key] = mapping
+            key_to_mapping[key] = mappings[mkey]
 
         with self.unlock():
             for mkey, mitems in updates.items():
@@ -186,6 +186,21 @@ async def test_contextvars(check_thread_leaks):
         assert await fut == {"x": 321}  # 1 + 20 (added by dump) + 300 (added by load)
 
 
+@pytest.mark.asyncio
+async def test_no_propagate_context(check_thread_leaks):
+    ctx = contextvars.ContextVar("v", default=0)
+
+    def dump(v):
+        return v + ctx.get()
+
+    with AsyncBuffer({}, Func(dump, dump, {}), n=0.1, propagate_context=False) as buff:
+        ctx.set(20)
+        buff["x"] = 1
+        await asyncio.wait(buff.futures)
+        assert buff.slow.d == {"x": 1}
+        assert await buff.async_get(["x"]) == {"x": 1}
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize("missing", ["raise", "omit"])
 async def test_race_condition_get_async_delitem(check_thread_leaks, missing):
@@ -270,3 +285,39 @@ async def test_external_executor():
     assert buff.slow == {"y": 2}
     assert n_submit == 2
     buff.close()
+
+
+@pytest.mark.asyncio
+async def test_does_not_block_event_loop(check_thread_leaks):
+    """async_get and async_evict_until_below_target don't acquire the Buffer's lock,
+    which may be held for a long time by the offloaded thread
+    """
+    locked = threading.Event()
+    release = threading.Event()
+
+    with AsyncBuffer({}, {}, n=10, weight=lambda k, v: v) as buff:
+        buff["x"] = 1
+
+        def hold_lock():
+            with buff.lock:
+                locked.set()
+                assert release.wait(timeout=5)
+
+        t = threading.Thread(target=hold_lock)
+        t.start()
+        try:
+            assert locked.wait(timeout=5)
+            future = buff.async_get(["x"])
+            assert future.done()
+            assert await future == {"x": 1}
+            # Total weight is above n; offload eviction without waiting for the lock
+            buff.n = 0.5
+            buff.async_evict_until_below_target()
+            assert len(buff.evicting) == 1
+        finally:
+            release.set()
+            t.join()
+
+        await asyncio.wait(list(buff.evicting))
+        assert buff.fast.d == {}
+        assert buff.slow == {"x": 1}
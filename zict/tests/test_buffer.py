@@ -1,3 +1,4 @@
+import gc
 import random
 import threading
 from collections import UserDict
@@ -5,7 +6,7 @@ from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
-from zict import Buffer
+from zict import AsyncBuffer, Buffer
 from zict.tests import utils_test
 
 
@@ -263,6 +264,97 @@ def test_set_noevict():
     assert f2s == ["y", "x"]
     assert s2f == []
 
+    # Overwrite a key in fast
+    buff.set_noevict("w", 1)
+    buff.set_noevict("w", 2)
+    assert a == {"w": 2}
+    assert buff.fast.weights == {"w": 2}
+    assert buff.fast.total_weight == 2
+
+
+def test_weight_called_once_on_restore():
+    calls = []
+
+    def weight(k, v):
+        calls.append(k)
+        return 1
+
+    buff = Buffer({}, {"x": 1}, n=10, weight=weight)
+    assert buff["x"] == 1
+    assert buff.fast.d == {"x": 1}
+    assert calls == ["x"]
+
+
+def test_promote_after():
+    s2f = []
+    buff = Buffer(
+        {},
+        {"x": 1, "y": 2},
+        n=10,
+        slow_to_fast_callbacks=lambda k, v: s2f.append(k),
+        promote_after=2,
+    )
+    assert buff["x"] == 1
+    assert buff.fast.d == {}
+    assert buff.slow == {"x": 1, "y": 2}
+    assert buff["x"] == 1
+    assert buff.fast.d == {"x": 1}
+    assert buff.slow == {"y": 2}
+    # Callbacks don't run when the key is not moved
+    assert s2f == ["x"]
+
+    # Updating or deleting a key resets its count
+    assert buff["y"] == 2
+    buff["y"] = 3
+    buff.fast.evict("y")
+    assert buff["y"] == 3
+    assert buff.slow == {"y": 3}
+    assert buff["y"] == 3
+    assert buff.slow == {}
+    assert not buff._touches
+
+
+def test_promote_after_forget():
+    """Keys that are read only once don't accumulate"""
+    buff = Buffer({}, {i: i for i in range(10)}, n=10, promote_after=2)
+    for i in range(9):
+        assert buff[i] == i
+    # Fast is empty; only the most recently read key is remembered
+    assert buff._touches == {8: 1}
+    assert buff[8] == 8
+    assert buff[0] == 0
+    assert buff.fast.d == {8: 8}
+    assert buff._touches == {0: 1}
+
+    buff[10] = 10
+    buff[11] = 11
+    assert buff[1] == 1
+    assert buff[2] == 2
+    assert buff[3] == 3
+    assert buff._touches == {1: 1, 2: 1, 3: 1}
+    assert buff[4] == 4
+    assert buff._touches == {2: 1, 3: 1, 4: 1}
+    assert buff[2] == 2
+    assert list(buff.fast.d) == [8, 10, 11, 2]
+    assert buff._touches == {3: 1, 4: 1}
+
+
+@pytest.mark.filterwarnings("error::pytest.PytestUnraisableExceptionWarning")
+@pytest.mark.parametrize("cls", [Buffer, AsyncBuffer])
+def test_promote_after_invalid(cls):
+    with pytest.raises(ValueError, match="promote_after"):
+        cls({}, {}, n=10, promote_after=0)
+    # __del__ -> close() of the object that failed to initialize doesn't raise
+    gc.collect()
+
+
+def test_getitem_fast_does_not_lock():
+    """A hit in fast does not need to acquire the Buffer's lock"""
+    buff = Buffer({}, {}, n=10)
+    buff["x"] = 1
+    with ThreadPoolExecutor(1) as ex, buff.lock:
+        assert ex.submit(buff.__getitem__, "x").result(timeout=5) == 1
+
 
 def test_evict_restore_during_iter():
     """Test that __iter__ won't be disrupted if another thread evicts or restores a key"""
@@ -133,6 +133,20 @@ def test_weakvaluemapping():
     d["b"] = b
     assert "b" not in d
 
+    # Subclasses of types that don't support weakrefs do support them, unless they
+    # define __slots__
+    class S(str):
+        pass
+
+    class T(str):
+        __slots__ = ()
+
+    s = S("sss")
+    d["s"] = s
+    assert d["s"] is s
+    d["t"] = T("ttt")
+    assert "t" not in d
+
 
 def test_mapping():
     """
@@ -148,6 +162,31 @@ def test_mapping():
     assert not buff._last_updated
 
 
+@pytest.mark.parametrize("update_on_set", [False, True])
+def test_update(update_on_set):
+    """update() issues a single call to data.update()"""
+    calls = []
+
+    class Data(utils_test.SimpleDict):
+        def _do_update(self, items):
+            items = list(items)
+            calls.append(items)
+            super()._do_update(items)
+
+    c = Cache(Data(), {}, update_on_set=update_on_set)
+    c["x"] = 1
+    _ = c["x"]
+    assert c.cache == {"x": 1}
+
+    c.update([("x", 2), ("y", 3), ("x", 4)])
+    assert calls == [[("x", 4), ("y", 3)]]
+    assert c.data.data == {"x": 4, "y": 3}
+    assert c.cache == ({"x": 4, "y": 3} if update_on_set else {})
+    assert c["x"] == 4
+    assert c["y"] == 3
+    assert c.cache == {"x": 4, "y": 3}
+
+
 @pytest.mark.parametrize("get_when", ("before", "after"))
 @pytest.mark.parametrize("set_when", ("before", "after"))
 @pytest.mark.parametrize(
@@ -217,6 +256,11 @@ def test_multithread_race_condition_set_get(
             set_fut = ex.submit(z.__setitem__, "x", 2)
             assert in_set.wait(timeout=5)
             get_fut = ex.submit(z.__getitem__, "x")
+            if seed and update_on_set:
+                # The cache is not invalidated until data.__setitem__ returns, so
+                # the previous value is served without hitting data
+                assert get_fut.result() == 1
+                in_get.set()
             assert in_get.wait(timeout=5)
 
         if ends_first == "get":
@@ -1,8 +1,12 @@
 import pickle
+import subprocess
+import sys
+from collections import UserDict
 
 import pytest
 
-from zict.common import locked
+import zict
+from zict.common import discard, locked
 from zict.tests.utils_test import SimpleDict
 
 
@@ -69,6 +73,16 @@ def test_discard():
     assert d.data == {"z": 2}
 
 
+@pytest.mark.parametrize("cls", [dict, UserDict, SimpleDict])
+def test_discard_function(cls):
+    d = cls()
+    d["x"] = 1
+    d["z"] = 2
+    discard(d, "x")
+    discard(d, "y")
+    assert dict(d) == {"z": 2}
+
+
 def test_pickle():
     d = SimpleDict()
     d["x"] = 1
@@ -106,3 +120,35 @@ def test_lock(is_locked):
     with pytest.raises(CustomError):
         d.f(crash=True)
     assert not is_locked(d)
+
+
+def test_lazy_import():
+    """import zict does not import asyncio until AsyncBuffer is accessed"""
+    code = (
+        "import sys, zict; "
+        "assert 'asyncio' not in sys.modules; "
+        "zict.Buffer, zict.LRU; "
+        "assert 'asyncio' not in sys.modules; "
+        "zict.AsyncBuffer; "
+        "assert 'asyncio' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_lazy_import_submodules():
+    """Submodules are accessible after import zict"""
+    code = (
+        "import zict; "
+        "assert zict.file.File is zict.File; "
+        "assert zict.lru.LRU is zict.LRU; "
+        "zict.buffer, zict.common, zict.utils; "
+        "assert not hasattr(zict, 'nonexistent')"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_dir():
+    assert "File" in dir(zict)
+    assert "__version__" in dir(zict)
+    assert "importlib" not in dir(zict)
+    assert "_lazy_imports" not in dir(zict)
@@ -1,9 +1,11 @@
 import os
 import pathlib
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
+import zict.file
 from zict import File
 from zict.tests import utils_test
 
@@ -32,8 +34,29 @@ def test_implementation(tmp_path, check_fd_leaks, dirtype):
     assert out == b"123"
 
 
-def test_memmap_implementation(tmp_path, check_fd_leaks):
-    z = File(tmp_path, memmap=True)
+@pytest.mark.parametrize("subdir", ["a", "a/b/c"])
+def test_create_directory(tmp_path, check_fd_leaks, subdir):
+    z = File(tmp_path / subdir)
+    assert os.path.isdir(tmp_path / subdir)
+    z["x"] = b"123"
+    assert File(tmp_path / subdir)["x"] == b"123"
+
+
+def test_import_ignores_subdirectories(tmp_path, check_fd_leaks):
+    z = File(tmp_path)
+    z["x"] = b"123"
+    (tmp_path / "subdir").mkdir()
+    z2 = File(tmp_path)
+    assert list(z2) == ["x"]
+    assert z2["x"] == b"123"
+
+
+@pytest.mark.parametrize("populate", [False, "madvise", True])
+def test_memmap_implementation(tmp_path, check_fd_leaks, monkeypatch, populate):
+    if populate == "madvise":
+        # MAP_POPULATE is not available
+        monkeypatch.setattr(zict.file, "_MMAP_FLAGS", 0)
+    z = File(tmp_path, memmap=True, populate=bool(populate))
     assert not z
 
     mv = memoryview(b"123")
@@ -48,6 +71,15 @@ def test_memmap_implementation(tmp_path, check_fd_leaks):
     assert mv2 == b"223"
 
 
+def test_advise(tmp_path, check_fd_leaks):
+    z = File(tmp_path, advise=True)
+    utils_test.check_mapping(z)
+    z["x"] = b"123"
+    z["y"] = [b"123", b"4567"]
+    assert z["x"] == b"123"
+    assert z["y"] == b"1234567"
+
+
 def test_str(tmp_path, check_fd_leaks):
     z = File(tmp_path)
     assert str(z) == repr(z) == f"<File: {tmp_path}, 0 elements>"
@@ -59,6 +91,90 @@ def test_setitem_typeerror(tmp_path, check_fd_leaks):
         z["x"] = 123
 
 
+def test_setitem_failure_keeps_previous_value(tmp_path, check_fd_leaks):
+    z = File(tmp_path)
+    z["x"] = b"123"
+    with pytest.raises(TypeError):
+        z["x"] = [b"456", 789]
+    assert z["x"] == b"123"
+    assert os.listdir(tmp_path) == ["x#0"]
+
+    # Overwrite a file imported from an existing directory
+    z = File(tmp_path)
+    z["x"] = b"456"
+    assert z["x"] == b"456"
+    assert os.listdir(tmp_path) == ["x#1"]
+
+
+def test_setitem_failure_cleanup_fails(tmp_path, check_fd_leaks, monkeypatch):
+    """The original exception is raised if the partially written file can't be
+    deleted
+    """
+    z = File(tmp_path)
+
+    def remove(path):
+        raise PermissionError(path)
+
+    monkeypatch.setattr(os, "remove", remove)
+    with pytest.raises(TypeError):
+        z["x"] = [b"123", 456]
+    assert "x" not in z
+
+
+def test_reimport_does_not_reuse_suffix(tmp_path, check_fd_leaks):
+    """The suffix of an imported file can be greater than or equal to the number of
+    files in the directory
+    """
+    z = File(tmp_path)
+    z["y"] = b"0"
+    z["x"] = b"1"
+    del z["y"]
+    assert os.listdir(tmp_path) == ["x#1"]
+
+    z = File(tmp_path)
+    z["x"] = b"2"
+    assert os.listdir(tmp_path) == ["x#2"]
+    assert z["x"] == b"2"
+    assert File(tmp_path)["x"] == b"2"
+
+
+def test_getitem_does_not_lock(tmp_path, check_fd_leaks):
+    z = File(tmp_path)
+    z["x"] = b"123"
+    with ThreadPoolExecutor(1) as ex, z.lock:
+        assert ex.submit(z.__getitem__, "x").result(timeout=5) == b"123"
+
+
+def test_getitem_race_condition(tmp_path, check_fd_leaks):
+    """Another thread deletes or replaces the key after __getitem__ looked up its
+    filename, but before it opened the file
+    """
+    z = File(tmp_path)
+    orig_read = z._read
+    actions = []
+
+    def _read(fn):
+        if actions:
+            actions.pop()()
+        return orig_read(fn)
+
+    z._read = _read
+
+    z["x"] = b"123"
+    actions.append(lambda: z.__setitem__("x", b"456"))
+    assert z["x"] == b"456"
+
+    actions.append(lambda: z.__delitem__("x"))
+    with pytest.raises(KeyError):
+        z["x"]
+
+    # File deleted from outside of zict
+    z["x"] = b"123"
+    actions.append(lambda: os.remove(tmp_path / z.filenames["x"]))
+    with pytest.raises(FileNotFoundError):
+        z["x"]
+
+
 def test_contextmanager(tmp_path, check_fd_leaks):
     with File(tmp_path) as z:
         z["x"] = b"123"
@@ -82,6 +198,49 @@ def test_delitem(tmp_path, check_fd_leaks):
     assert os.listdir(tmp_path) == ["x#2"]
 
 
+def test_clear(tmp_path, check_fd_leaks):
+    z = File(tmp_path)
+    z["x"] = b"123"
+    z["y"] = b"456"
+    z.clear()
+    assert not z
+    assert not z._sizes
+    assert os.listdir(tmp_path) == []
+    z["x"] = b"789"
+    assert z["x"] == b"789"
+
+
+def test_clear_remove_fails(tmp_path, check_fd_leaks, monkeypatch):
+    """clear() deletes all files it can even if some can't be deleted"""
+    z = File(tmp_path)
+    z["x"] = b"1"
+    z["y"] = b"2"
+    z["z"] = b"3"
+
+    # File deleted from outside of zict
+    os.remove(tmp_path / z.filenames["x"])
+    z.clear()
+    assert not z
+    assert os.listdir(tmp_path) == []
+
+    z["x"] = b"1"
+    z["y"] = b"2"
+    z["z"] = b"3"
+    y_fn = z.filenames["y"]
+    orig_remove = os.remove
+
+    def remove(path):
+        if path.endswith(y_fn):
+            raise PermissionError(path)
+        orig_remove(path)
+
+    monkeypatch.setattr(os, "remove", remove)
+    with pytest.raises(PermissionError):
+        z.clear()
+    assert not z
+    assert os.listdir(tmp_path) == [y_fn]
+
+
 def test_missing_key(tmp_path, check_fd_leaks):
     z = File(tmp_path)
 
@@ -118,6 +277,17 @@ def test_arbitrary_chars(tmp_path, check_fd_leaks):
             z[key]
 
 
+def test_alnum_keys_skip_quote(tmp_path, check_fd_leaks):
+    z = File(tmp_path)
+    info = zict.file._quote.cache_info()
+    z["deadbeef0123"] = b"1"
+    assert zict.file._quote.cache_info() == info
+    assert os.listdir(tmp_path) == ["deadbeef0123#0"]
+    z["dead beef"] = b"2"
+    assert zict.file._quote.cache_info() != info
+    assert sorted(os.listdir(tmp_path)) == ["dead%20beef#1", "deadbeef0123#0"]
+
+
 def test_write_list_of_bytes(tmp_path, check_fd_leaks):
     z = File(tmp_path)
 
@@ -125,6 +295,92 @@ def test_write_list_of_bytes(tmp_path, check_fd_leaks):
     assert z["x"] == b"1234567"
 
 
+def test_write_many_buffers(tmp_path, check_fd_leaks):
+    """More buffers than IOV_MAX, of different types, including empty ones"""
+    z = File(tmp_path)
+    value = [b"", bytearray(b"1"), memoryview(b"23")] * 1000
+    z["x"] = value
+    assert z["x"] == b"123" * 1000
+    z["y"] = tuple(value)
+    assert z["y"] == b"123" * 1000
+
+
+@pytest.mark.parametrize("sysconf,expect", [(16, 16), (-1, 1024), (0, 1024)])
+def test_iov_max(monkeypatch, sysconf, expect):
+    monkeypatch.setattr(os, "sysconf", lambda name: sysconf, raising=False)
+    assert zict.file._get_iov_max() == expect
+
+
+def test_cached_sizes(tmp_path, check_fd_leaks, monkeypatch):
+    """Files written by this instance are read back without calling fstat"""
+    z = File(tmp_path)
+    z["x"] = b"123"
+    z["y"] = [b"123", memoryview(b"4567")]
+    assert sorted(z._sizes.values()) == [3, 7]
+
+    with monkeypatch.context() as m:
+        m.setattr(os, "fstat", None)
+        assert z["x"] == b"123"
+        assert z["y"] == b"1234567"
+
+    # Files imported from an existing directory are measured on read
+    z2 = File(tmp_path)
+    assert not z2._sizes
+    assert z2["y"] == b"1234567"
+
+    del z["x"]
+    z["y"] = b"1"
+    assert list(z._sizes.values()) == [1]
+
+
+@pytest.mark.skipif(not hasattr(os, "O_NOATIME"), reason="Needs O_NOATIME")
+def test_noatime_not_permitted(tmp_path, check_fd_leaks, monkeypatch):
+    """O_NOATIME is not permitted on files owned by another user"""
+    orig_open = os.open
+
+    def open_(path, flags, *args, **kwargs):
+        if flags & os.O_NOATIME:
+            raise PermissionError(path)
+        return orig_open(path, flags, *args, **kwargs)
+
+    monkeypatch.setattr(os, "open", open_)
+    z = File(tmp_path)
+    z["x"] = b"123"
+    assert z["x"] == b"123"
+
+
+def test_without_readv_writev(tmp_path, check_fd_leaks, monkeypatch):
+    """Windows doesn't have os.readv and os.writev"""
+    monkeypatch.delattr(os, "readv", raising=False)
+    monkeypatch.delattr(os, "writev", raising=False)
+    z = File(tmp_path)
+    z["x"] = b"123"
+    z["y"] = [b"123", memoryview(b"4567")]
+    assert z["x"] == b"123"
+    assert z["y"] == b"1234567"
+
+
+@pytest.mark.skipif(not hasattr(os, "writev"), reason="Needs os.writev")
+def test_writev_partial(tmp_path, check_fd_leaks, monkeypatch):
+    """os.writev may write fewer bytes than requested"""
+    orig_writev = os.writev
+
+    def writev(fd, buffers):
+        # Write at most 3 bytes at a time
+        out = []
+        size = 0
+        for buf in buffers:
+            buf = bytes(buf)[: 3 - size]
+            out.append(buf)
+            size += len(buf)
+        return orig_writev(fd, out)
+
+    monkeypatch.setattr(os, "writev", writev)
+    z = File(tmp_path)
+    z["x"] = [b"12", b"", b"3456", b"7"]
+    assert z["x"] == b"1234567"
+
+
 def test_bad_types(tmp_path, check_fd_leaks):
     z = File(tmp_path)
     utils_test.check_bad_key_types(z)
@@ -1,5 +1,7 @@
 import os
 import pathlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
@@ -67,3 +69,56 @@ def test_map_size(tmp_path, check_fd_leaks):
     z["x"] = b"x" * 2**19
     with pytest.raises(lmdb.MapFullError):
         z["y"] = b"x" * 2**20
+
+
+def test_update(tmp_path, check_fd_leaks):
+    with LMDB(tmp_path) as z:
+        z.update([])
+        # Empty database; keys are appended
+        z.update([("b", b"1"), ("a", b"2"), ("b", b"3")])
+        assert dict(z.items()) == {"a": b"2", "b": b"3"}
+        # All new keys sort after the existing ones; keys are appended
+        z.update({"d": b"4", "c": b"5"})
+        # Some keys sort before the existing ones or overwrite them
+        z.update({"e": b"6", "aa": b"7", "d": b"8"})
+        assert dict(z.items()) == {
+            "a": b"2",
+            "aa": b"7",
+            "b": b"3",
+            "c": b"5",
+            "d": b"8",
+            "e": b"6",
+        }
+
+
+def test_getmany(tmp_path, check_fd_leaks):
+    with LMDB(tmp_path) as z:
+        z["x"] = b"123"
+        z["y"] = b"456"
+        assert z.contains_many(["y", "z", 1, "x"]) == [True, False, False, True]
+        assert z.contains_many([]) == []
+        assert z.getmany(["y", "z", 1, "x"]) == {"x": b"123", "y": b"456"}
+        assert z.getmany([]) == {}
+
+
+def test_read_while_writing(tmp_path, check_fd_leaks):
+    """Buffer reads from slow on one thread while it writes to it on another"""
+    with LMDB(tmp_path) as z:
+        z["x"] = b"123"
+        stop = threading.Event()
+
+        def write():
+            i = 0
+            while not stop.is_set():
+                z[f"y{i % 10}"] = b"456"
+                i += 1
+
+        with ThreadPoolExecutor(1) as ex:
+            fut = ex.submit(write)
+            try:
+                for _ in range(5000):
+                    assert z["x"] == b"123"
+                    assert "x" in z
+            finally:
+                stop.set()
+            fut.result()
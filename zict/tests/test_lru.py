@@ -83,6 +83,43 @@ def test_overwrite():
     assert set(lru) == {"x", "y"}
 
 
+def test_overwrite_delitem_fails():
+    """d.__delitem__ raises while overwriting a key; LRU state remains consistent"""
+
+    class D(dict):
+        def __delitem__(self, key):
+            raise OSError()
+
+    lru = LRU(10, D(), weight=lambda k, v: v)
+    lru["x"] = 1
+    with pytest.raises(OSError):
+        lru["x"] = 2
+    assert lru["x"] == 1
+    assert lru.weights == {"x": 1}
+    assert lru.total_weight == 1
+    assert list(lru.order) == ["x"]
+
+
+def test_overwrite_calls_delitem():
+    """Overwriting a key goes through __delitem__, which subclasses may override"""
+    deleted = []
+
+    class MyLRU(LRU):
+        def __delitem__(self, key):
+            deleted.append(key)
+            super().__delitem__(key)
+
+    lru = MyLRU(10, {})
+    lru["x"] = 1
+    lru.set_noevict("y", 2)
+    assert deleted == []
+    lru["x"] = 3
+    lru.set_noevict("y", 4)
+    assert deleted == ["x", "y"]
+    assert lru.d == {"x": 3, "y": 4}
+    assert lru.total_weight == 2
+
+
 def test_callbacks():
     count = [0]
 
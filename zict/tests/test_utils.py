@@ -71,7 +71,16 @@ def test_insertion_sorted_set():
     s.add(7)
     assert list(s) == [3, 1, 5, 4, 6, 0, 2, 7]
 
-    assert [s.popleft() for _ in range(len(s))] == [3, 1, 5, 4, 6, 0, 2, 7]
+    # move_to_end() is the same as remove() + add()
+    s.move_to_end(1)
+    assert list(s) == [3, 5, 4, 6, 0, 2, 7, 1]
+    s.move_to_end(1)
+    assert list(s) == [3, 5, 4, 6, 0, 2, 7, 1]
+    with pytest.raises(KeyError):
+        s.move_to_end(8)
+    assert list(s) == [3, 5, 4, 6, 0, 2, 7, 1]
+
+    assert [s.popleft() for _ in range(len(s))] == [3, 5, 4, 6, 0, 2, 7, 1]
 
     s |= [3, 1, 5, 4, 6, 0, 2, 7]
     assert [s.popright() for _ in range(len(s))] == [7, 2, 0, 6, 4, 5, 1, 3]
@@ -34,15 +34,26 @@ class InsertionSortedSet(MutableSet[T]):
         self._d[value] = None
 
     def discard(self, value: T) -> None:
-        # Don't trust the thread-safety of self._d.pop(value, None)
-        try:
-            del self._d[value]
-        except KeyError:
-            pass
+        # Don't trust the thread-safety of self._d.pop(value, None).
+        # Check for membership first to avoid raising and catching KeyError in the
+        # common case of a missing value, e.g. LRU.heavy is almost always empty.
+        if value in self._d:
+            try:
+                del self._d[value]
+            except KeyError:  # Multithreaded race condition
+                pass
 
     def remove(self, value: T) -> None:
         del self._d[value]
 
+    def move_to_end(self, value: T) -> None:
+        """Move an existing element to the end of the set, as if it had been removed
+        and added again. Raise KeyError if the element is not in the set.
+        """
+        d = self._d
+        del d[value]
+        d[value] = None
+
     def popleft(self) -> T:
         """Pop the oldest-inserted key from the set"""
         while True: